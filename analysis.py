@@ -0,0 +1,299 @@
+import struct
+import sys
+from argparse import ArgumentParser, FileType
+from array import array
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import BinaryIO, Dict, Iterator, List, Tuple
+
+from board import Board
+from gametree import GameTree, GameTreeNode
+from player import ComputerPlayer
+
+
+@dataclass
+class PositionAnalysis:
+
+    score: int
+    best_moves: List[int]
+    winner: str | None
+
+    def __repr__(self) -> str:
+        return (
+            "PositionAnalysis:\n"
+            f"score: {self.score}\n"
+            f"best_moves: {self.best_moves}\n"
+            f"winner: {self.winner}"
+        )
+
+
+class PositionAnalyzer:
+
+    CSV_SEP: str = ";"
+    MOVE_SEP: str = ","
+    EMPTY_ALIASES: bytes = b".-_"
+    CHUNK_SIZE: int = 1 << 20
+
+    PACKED_BASE: int = 3
+    PACKED_CELLS: List[str] = [Board.EMPTY, Board.PLAYER_X, Board.PLAYER_O]
+    PACKED_POSITION_FORMAT: str = "<H"
+    PACKED_ANALYSIS_FORMAT: str = "<bHc"
+    PACKED_NO_WINNER: bytes = b"-"
+
+    _analyses: Dict[str, PositionAnalysis]
+    _line_table: Dict[bytes, bytes]
+    _packed_table: Dict[int, bytes]
+    _empty_translation: bytes
+
+    @classmethod
+    def pack(cls, board: Board) -> int:
+        code = 0
+        for idx in reversed(range(Board.SIZE)):
+            code = code * cls.PACKED_BASE + cls.PACKED_CELLS.index(board[idx])
+        return code
+
+    @classmethod
+    def unpack(cls, code: int) -> Board:
+        board = Board()
+        for idx in range(Board.SIZE):
+            code, digit = divmod(code, cls.PACKED_BASE)
+            board[idx] = cls.PACKED_CELLS[digit]
+        return board
+
+    @staticmethod
+    def _cells(board: Board) -> str:
+        return "".join(board[idx] for idx in range(Board.SIZE))
+
+    @staticmethod
+    def _reachable_boards() -> Iterator[Board]:
+        found = {PositionAnalyzer._cells(Board())}
+        boards = [Board()]
+        while boards:
+            board = boards.pop()
+            yield board
+            if board.winner() is not None:
+                continue
+            is_first = board.free_cell_amount % 2 == 1
+            for idx in board.free_cell_indices():
+                child = board.place_move(is_first, idx)
+                cells = PositionAnalyzer._cells(child)
+                if cells not in found:
+                    found.add(cells)
+                    boards.append(child)
+
+    def __init__(self, gametree: GameTree | None = None):
+        if gametree is None:
+            gametree = GameTree.new()
+        self._analyses = {}
+        self._line_table = {}
+        self._packed_table = {}
+        for board in self._reachable_boards():
+            self._add_position(gametree, board)
+        self._empty_translation = bytes.maketrans(
+            self.EMPTY_ALIASES,
+            Board.EMPTY.encode() * len(self.EMPTY_ALIASES)
+        )
+
+    def __repr__(self) -> str:
+        return f"PositionAnalyzer<# positions: {len(self._analyses)}>"
+
+    def _add_position(self, gametree: GameTree, board: Board):
+        winner = board.winner()
+        is_first = board.free_cell_amount % 2 == 1
+        best_moves = (
+            [] if winner is not None
+            else sorted(gametree.best_moves(board, is_first))
+        )
+        analysis = PositionAnalysis(gametree.score(board), best_moves, winner)
+        cells = self._cells(board)
+        self._analyses[cells] = analysis
+        self._line_table[cells.encode()] = self.CSV_SEP.join((
+            cells,
+            str(analysis.score),
+            self.MOVE_SEP.join(str(m) for m in best_moves),
+            winner or ""
+        )).encode() + b"\n"
+        self._packed_table[self.pack(board)] = struct.pack(
+            self.PACKED_ANALYSIS_FORMAT,
+            analysis.score,
+            sum(1 << m for m in best_moves),
+            winner.encode() if winner is not None else self.PACKED_NO_WINNER
+        )
+
+    def analyze(self, board: Board) -> PositionAnalysis:
+        try:
+            return self._analyses[self._cells(board)]
+        except KeyError:
+            raise ValueError(
+                f"Position is not reachable:\n{board}"
+            ) from None
+
+    def analyze_lines(self, source: BinaryIO, destination: BinaryIO) -> int:
+        amount = 0
+        while lines := source.readlines(self.CHUNK_SIZE):
+            positions = (
+                b"".join(lines).translate(self._empty_translation)
+                .splitlines()
+            )
+            try:
+                destination.write(
+                    b"".join(map(self._line_table.__getitem__, positions))
+                )
+            except KeyError as error:
+                raise ValueError(
+                    f"Invalid or unreachable position: {error.args[0]!r}"
+                ) from None
+            amount += len(positions)
+        return amount
+
+    def analyze_packed(self, source: BinaryIO, destination: BinaryIO) -> int:
+        position_size = struct.calcsize(self.PACKED_POSITION_FORMAT)
+        chunk_size = self.CHUNK_SIZE - self.CHUNK_SIZE % position_size
+        amount = 0
+        while chunk := source.read(chunk_size):
+            if len(chunk) % position_size:
+                raise ValueError("Truncated packed position!")
+            codes = array(self.PACKED_POSITION_FORMAT[1:])
+            codes.frombytes(chunk)
+            if sys.byteorder != "little":
+                codes.byteswap()
+            try:
+                destination.write(
+                    b"".join(map(self._packed_table.__getitem__, codes))
+                )
+            except KeyError as error:
+                raise ValueError(
+                    f"Invalid or unreachable packed position: {error.args[0]}"
+                ) from None
+            amount += len(codes)
+        return amount
+
+
+class OutcomeAnalyzer:
+
+    _gametree: GameTree
+    _plies: List[List[GameTreeNode]]
+    _score_layer: str
+    _distributions: Dict[Tuple[int, int], Dict[str, Fraction]]
+
+    def __init__(
+        self, gametree: GameTree | None = None,
+        score_layer: str = GameTree.OUTCOME_LAYER
+    ):
+        self._gametree = GameTree.new() if gametree is None else gametree
+        self._plies = self._gametree.nodes_by_ply()
+        self._score_layer = score_layer
+        self._distributions = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"OutcomeAnalyzer<score_layer: {self._score_layer}, "
+            f"# memoized difficulty pairs: {len(self._distributions)}>"
+        )
+
+    def distribution(
+        self, first_player_difficulty: int, second_player_difficulty: int
+    ) -> Dict[str, Fraction]:
+        key = (first_player_difficulty, second_player_difficulty)
+        if key not in self._distributions:
+            self._distributions[key] = self._propagate(*key)
+        return dict(self._distributions[key])
+
+    def all_distributions(self) -> Dict[Tuple[int, int], Dict[str, Fraction]]:
+        difficulties = range(len(ComputerPlayer.DIFFICULTIES))
+        return {
+            (first, second): self.distribution(first, second)
+            for first in difficulties for second in difficulties
+        }
+
+    def _propagate(
+        self, first_player_difficulty: int, second_player_difficulty: int
+    ) -> Dict[str, Fraction]:
+        outcomes = {
+            Board.PLAYER_X: Fraction(0),
+            Board.TIE: Fraction(0),
+            Board.PLAYER_O: Fraction(0)
+        }
+        masses = {self._gametree.root: Fraction(1)}
+        for ply, nodes in enumerate(self._plies):
+            maximizing = ply % 2 == 0
+            difficulty = (
+                first_player_difficulty if maximizing
+                else second_player_difficulty
+            )
+            for node in nodes:
+                mass = masses.pop(node, None)
+                if mass is None:
+                    continue
+                if node.is_terminal:
+                    outcomes[node.winner] += mass
+                    continue
+                if ComputerPlayer.takes_best_move(node.board, difficulty):
+                    transitions = self._gametree.best_transitions(
+                        node, maximizing, self._score_layer
+                    )
+                else:
+                    transitions = node.children
+                share = mass / len(transitions)
+                for transition in transitions:
+                    masses[transition.node] = (
+                        masses.get(transition.node, 0) + share
+                    )
+        return outcomes
+
+
+def write_outcomes(analyzer: OutcomeAnalyzer, destination: BinaryIO):
+    winners = [Board.PLAYER_X, Board.TIE, Board.PLAYER_O]
+    lines = [PositionAnalyzer.CSV_SEP.join(
+        ["X_difficulty", "O_difficulty", *winners]
+    )]
+    for (first, second), distribution in analyzer.all_distributions().items():
+        lines.append(PositionAnalyzer.CSV_SEP.join(
+            [str(first), str(second)]
+            + [f"{float(distribution[w]):.6f}" for w in winners]
+        ))
+    destination.write(("\n".join(lines) + "\n").encode())
+    destination.flush()
+
+
+def main():
+    parser = ArgumentParser(
+        description="Analyze TicTacToe positions with the solved game tree."
+    )
+    parser.add_argument(
+        "input", nargs="?", type=FileType('rb'), default=sys.stdin.buffer,
+        help="positions, one 9 character board per line "
+        "(empty cells as ' ' or one of '.-_'); defaults to stdin"
+    )
+    parser.add_argument(
+        "-o", "--output", type=FileType('wb'), default=sys.stdout.buffer,
+        help="destination of the analyses; defaults to stdout"
+    )
+    parser.add_argument(
+        "--packed", action="store_true",
+        help="read base 3 encoded positions as little endian uint16 and "
+        "write (int8 score, uint16 best move mask, winner byte) records"
+    )
+    parser.add_argument(
+        "--outcomes", action="store_true",
+        help="instead of analyzing positions, write the exact X/tie/O "
+        "probabilities of random computer players for all difficulty pairs"
+    )
+    args = parser.parse_args()
+    if args.outcomes:
+        write_outcomes(OutcomeAnalyzer(), args.output)
+        return
+    analyzer = PositionAnalyzer()
+    try:
+        if args.packed:
+            analyzer.analyze_packed(args.input, args.output)
+        else:
+            analyzer.analyze_lines(args.input, args.output)
+    except ValueError as error:
+        parser.exit(1, f"{error}\n")
+    finally:
+        args.output.flush()
+
+
+if __name__ == "__main__":
+    main()
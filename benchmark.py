@@ -1,28 +1,98 @@
+from argparse import ArgumentParser
+from collections import Counter
+from contextlib import nullcontext
+from io import BytesIO
 from itertools import product
 from multiprocessing import Pool, cpu_count
-from typing import Iterator, List
+from typing import Iterator, List, Tuple
 
 from game import Game
+from movelog import MoveLogWriter
 from player import ComputerPlayer, Strategy
 from ui import DummyUi
 
 
+class BenchmarkSummary:
+
+    DIFFICULTIES: str = "difficulties"
+    X_STRATEGY: str = "X_strategy"
+    O_STRATEGY: str = "O_strategy"
+    WINNER: str = "winner"
+
+    _counts: Counter
+
+    def __init__(self):
+        self._counts = Counter()
+
+    def __repr__(self) -> str:
+        return f"BenchmarkSummary<# games: {self.game_amount}>"
+
+    def add(self, result: List[int | str]):
+        (
+            first_player_strategy, second_player_strategy,
+            first_player_difficulty, second_player_difficulty,
+            winner
+        ) = result
+        self._counts[(
+            self.DIFFICULTIES,
+            f"{first_player_difficulty},{second_player_difficulty}",
+            winner
+        )] += 1
+        self._counts[(self.X_STRATEGY, first_player_strategy, winner)] += 1
+        self._counts[(self.O_STRATEGY, second_player_strategy, winner)] += 1
+        self._counts[(self.WINNER, "", winner)] += 1
+
+    def merge(self, other: 'BenchmarkSummary') -> 'BenchmarkSummary':
+        self._counts.update(other._counts)
+        return self
+
+    def count(self, category: str, key: str, winner: str) -> int:
+        return self._counts[(category, key, winner)]
+
+    @property
+    def game_amount(self) -> int:
+        return sum(
+            count for (category, _, _), count in self._counts.items()
+            if category == self.WINNER
+        )
+
+    def rows(self) -> Iterator[List[int | str]]:
+        for (category, key, winner), count in sorted(self._counts.items()):
+            yield [category, key, winner, count]
+
+
 class Benchmark:
 
     CSV_SEP: str = ";"
+    CSV_FILENAME: str = "benchmark.csv"
+    SUMMARY_FILENAME: str = "benchmark_summary.csv"
+    MOVE_LOG_FILENAME: str = "benchmark_moves.bin"
     UI: DummyUi = DummyUi()
 
+    _write_rows: bool
+    _record_moves: bool
+
+    def __init__(self, write_rows: bool = True, record_moves: bool = False):
+        self._write_rows = write_rows
+        self._record_moves = record_moves
+
     def _run_game(
         self, first_player_strategy: Strategy,
         second_player_strategy: Strategy,
-        first_player_difficulty: int, second_player_difficulty: int
+        first_player_difficulty: int, second_player_difficulty: int,
+        move_log_writer: MoveLogWriter | None
     ) -> str:
         first_player = ComputerPlayer(True, first_player_strategy, False)
         first_player.set_difficulty(first_player_difficulty)
         second_player = ComputerPlayer(True, second_player_strategy, False)
         second_player.set_difficulty(second_player_difficulty)
-        game = Game(first_player, second_player, self.UI)
-        return game.run()
+        game = Game(
+            first_player, second_player, self.UI, move_log_writer is not None
+        )
+        winner = game.run()
+        if move_log_writer is not None:
+            move_log_writer.write(game.move_log)
+        return winner
 
     def _generate_csv_content(self, results: Iterator[List[int | str]]) -> str:
         return "\n".join(
@@ -33,7 +103,8 @@ class Benchmark:
         )
 
     def _result_generator(
-        self, first_player_strategy: Strategy
+        self, first_player_strategy: Strategy,
+        move_log_writer: MoveLogWriter | None
     ) -> Iterator[List[int | str]]:
         for (
             second_player_strategy,
@@ -51,26 +122,80 @@ class Benchmark:
                 second_player_difficulty,
                 self._run_game(
                     first_player_strategy, second_player_strategy,
-                    first_player_difficulty, second_player_difficulty
+                    first_player_difficulty, second_player_difficulty,
+                    move_log_writer
                 )
             ]
 
-    def _process_target(self, first_player_strategy: Strategy):
-        return self._generate_csv_content(
-            self._result_generator(first_player_strategy)
+    def _summarizing_generator(
+        self, results: Iterator[List[int | str]], summary: BenchmarkSummary
+    ) -> Iterator[List[int | str]]:
+        for result in results:
+            summary.add(result)
+            yield result
+
+    def _process_target(
+        self, first_player_strategy: Strategy
+    ) -> Tuple[str, BenchmarkSummary, bytes]:
+        summary = BenchmarkSummary()
+        move_logs = BytesIO()
+        move_log_writer = (
+            MoveLogWriter(move_logs) if self._record_moves else None
+        )
+        results = self._summarizing_generator(
+            self._result_generator(first_player_strategy, move_log_writer),
+            summary
         )
+        if self._write_rows:
+            content = self._generate_csv_content(results)
+        else:
+            content = ""
+            for _ in results:
+                pass
+        return content, summary, move_logs.getvalue()
 
-    def run(self):
-        with Pool(processes=cpu_count()) as pool:
-            results = pool.map(
+    def _write_summary(self, summary: BenchmarkSummary):
+        with open(self.SUMMARY_FILENAME, 'w') as file:
+            file.write(self._generate_csv_content(summary.rows()))
+            file.write("\n")
+
+    def run(self) -> BenchmarkSummary:
+        summary = BenchmarkSummary()
+        with (
+            Pool(processes=cpu_count()) as pool,
+            open(self.CSV_FILENAME, 'a') if self._write_rows
+            else nullcontext() as csv_file,
+            open(self.MOVE_LOG_FILENAME, 'ab') if self._record_moves
+            else nullcontext() as move_log_file
+        ):
+            results = pool.imap(
                 self._process_target,
                 Strategy.all_player_strategies(True)
             )
-        with open("benchmark.csv", 'a') as file:
-            for result in results:
-                file.write(f"{result}\n")
+            for content, partial_summary, move_logs in results:
+                if csv_file is not None:
+                    csv_file.write(f"{content}\n")
+                if move_log_file is not None:
+                    move_log_file.write(move_logs)
+                summary.merge(partial_summary)
+        self._write_summary(summary)
+        return summary
 
 
 if __name__ == "__main__":
-    benchmark = Benchmark()
+    parser = ArgumentParser(
+        description="Simulate all combinations of computer players."
+    )
+    parser.add_argument(
+        "--summary-only", action="store_true",
+        help=f"only write {Benchmark.SUMMARY_FILENAME}, "
+        f"not the raw rows to {Benchmark.CSV_FILENAME}"
+    )
+    parser.add_argument(
+        "--record-moves", action="store_true",
+        help="append the move log of every game to "
+        f"{Benchmark.MOVE_LOG_FILENAME}, in the same order as the rows"
+    )
+    args = parser.parse_args()
+    benchmark = Benchmark(not args.summary_only, args.record_moves)
     benchmark.run()
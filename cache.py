@@ -0,0 +1,160 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, Type
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+class CacheError(Exception):
+    pass
+
+
+class FileLock:
+
+    _path: Path
+    _file: BinaryIO | None
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._file = None
+
+    def __repr__(self) -> str:
+        return f"FileLock<path: {self._path}, locked: {self.locked}>"
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, *_):
+        self.release()
+
+    def acquire(self):
+        self._file = open(self._path, 'a+b')
+        if sys.platform == "win32":
+            self._file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass
+        else:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+
+    def release(self):
+        if self._file is None:
+            return
+        if sys.platform == "win32":
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+    @property
+    def locked(self) -> bool:
+        return self._file is not None
+
+
+class PickleCache:
+
+    MAGIC: bytes = b"TTTCACHE"
+    DIGEST_SIZE: int = hashlib.sha256().digest_size
+    HEADER_SIZE: int = len(MAGIC) + 2 * DIGEST_SIZE
+    FINGERPRINT_LENGTH: int = 12
+    LOCK_SUFFIX: str = ".lock"
+    FILE_MODE: int = 0o644
+
+    _path: Path
+    _fingerprint: bytes
+
+    @classmethod
+    def fingerprint_of(
+        cls, version: int, types: Iterable[Type]
+    ) -> bytes:
+        fingerprint = hashlib.sha256(f"{version}".encode())
+        modules = sorted({t.__module__ for t in types})
+        for module in modules:
+            fingerprint.update(module.encode())
+            fingerprint.update(Path(sys.modules[module].__file__).read_bytes())
+        return fingerprint.digest()
+
+    def __init__(self, filename: str, fingerprint: bytes):
+        path = Path(filename)
+        self._path = path.with_name(
+            f"{path.stem}.{fingerprint.hex()[:self.FINGERPRINT_LENGTH]}"
+            f"{path.suffix}"
+        )
+        self._fingerprint = fingerprint
+
+    def __repr__(self) -> str:
+        return f"PickleCache<path: {self._path}>"
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def lock_path(self) -> Path:
+        return self._path.with_name(self._path.name + self.LOCK_SUFFIX)
+
+    def load(self) -> Any:
+        try:
+            data = self._path.read_bytes()
+        except FileNotFoundError:
+            raise CacheError(f"{self._path} does not exist!") from None
+        magic = data[:len(self.MAGIC)]
+        fingerprint = data[len(self.MAGIC):len(self.MAGIC) + self.DIGEST_SIZE]
+        digest = data[len(self.MAGIC) + self.DIGEST_SIZE:self.HEADER_SIZE]
+        payload = data[self.HEADER_SIZE:]
+        if magic != self.MAGIC:
+            raise CacheError(f"{self._path} is not a cache file!")
+        if fingerprint != self._fingerprint:
+            raise CacheError(f"{self._path} has a different fingerprint!")
+        if digest != hashlib.sha256(payload).digest():
+            raise CacheError(f"{self._path} is corrupted!")
+        try:
+            return pickle.loads(payload)
+        except Exception as error:
+            raise CacheError(f"{self._path} cannot be unpickled!") from error
+
+    def store(self, value: Any):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        directory = self._path.parent
+        file_descriptor, temporary_name = tempfile.mkstemp(
+            prefix=f".{self._path.name}.", dir=directory
+        )
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                file.write(self.MAGIC)
+                file.write(self._fingerprint)
+                file.write(hashlib.sha256(payload).digest())
+                file.write(payload)
+                file.flush()
+                os.fsync(file.fileno())
+            os.chmod(temporary_name, self.FILE_MODE)
+            os.replace(temporary_name, self._path)
+        except BaseException:
+            os.unlink(temporary_name)
+            raise
+
+    def load_or_build(self, build: Callable[[], Any]) -> Any:
+        try:
+            return self.load()
+        except CacheError:
+            pass
+        with FileLock(self.lock_path):
+            try:
+                return self.load()
+            except CacheError:
+                value = build()
+                self.store(value)
+                return value
@@ -1,6 +1,7 @@
 from typing import List, Protocol
 
 from board import Board
+from movelog import MoveLog
 from player import Player
 
 
@@ -16,16 +17,22 @@ class Game:
     _current_player: Player
     _board: Board
     _ui = UiProtocol
+    _move_log: MoveLog | None
 
     def __init__(
-        self, first_player: Player, second_player: Player, ui: UiProtocol
+        self, first_player: Player, second_player: Player, ui: UiProtocol,
+        record_moves: bool = False, move_deadline: float | None = None
     ):
         self._players = [first_player, second_player]
         self._players[0].is_first = True
         self._players[1].is_first = False
+        if move_deadline is not None:
+            for player in self._players:
+                player.move_deadline = move_deadline
         self._current_player = self._players[0]
         self._board = Board()
         self._ui = ui
+        self._move_log = MoveLog() if record_moves else None
 
     def __repr__(self) -> str:
         return (
@@ -41,14 +48,27 @@ class Game:
             1 - self._players.index(self._current_player)
         ]
 
+    def _record_move(self, previous_board: Board):
+        self._move_log.append(next(
+            idx for idx in previous_board.free_cell_indices()
+            if self._board[idx] != Board.EMPTY
+        ))
+
     def run(self) -> str:
         return self._mainloop()
 
+    @property
+    def move_log(self) -> MoveLog | None:
+        return self._move_log
+
     def _mainloop(self) -> str:
         winner = None
         while not winner:
             self._ui.print_term(self._current_player.is_first)
+            previous_board = self._board
             self._board = self._current_player.make_move(self._board)
+            if self._move_log is not None:
+                self._record_move(previous_board)
             self._ui.print_board(self._board)
             self._ui.print_empty_line()
             self._switch_current_player()
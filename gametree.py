@@ -1,10 +1,20 @@
-import pickle
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 from board import Board
+from cache import PickleCache
 from transformation import Transformation
 
+ScoreFunction = Callable[[Board, int], float]
+
+
+def outcome_score(board: Board, _: int) -> int:
+    return board.score
+
+
+def depth_aware_score(board: Board, ply: int) -> int:
+    return board.score * (Board.SIZE + 1 - ply)
+
 
 @dataclass
 class Transition:
@@ -24,7 +34,7 @@ class GameTreeNode:
 
     _board: Board
     _children: List[Transition]
-    _score: int
+    _index: int
     _visited: bool
 
     def __init__(
@@ -32,13 +42,13 @@ class GameTreeNode:
     ):
         self._board = board
         self._children = []
-        self._score = None
+        self._index = None
         self._visited = False
 
     def __repr__(self) -> str:
         return (
             "GameTreeNode\n"
-            f"score: {self._score}\n"
+            f"index: {self._index}\n"
             f"# children: {len(self._children)}\n"
             f"{repr(self._board)}"
         )
@@ -49,19 +59,6 @@ class GameTreeNode:
         self._children.append(Transition(index, node))
         return node
 
-    def determine_score(self, maximizing: bool) -> int:
-        if self._score is not None:
-            return self._score
-        if self.is_terminal:
-            self._score = self._board.score
-        else:
-            operator = max if maximizing else min
-            self._score = operator(
-                c.node.determine_score(not maximizing)
-                for c in self._children
-            )
-        return self._score
-
     @property
     def children(self) -> List[Transition]:
         return self._children
@@ -79,8 +76,16 @@ class GameTreeNode:
         return self._board
 
     @property
-    def score(self) -> int:
-        return self._score
+    def ply(self) -> int:
+        return Board.SIZE - self._board.free_cell_amount
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @index.setter
+    def index(self, value: int):
+        self._index = value
 
     @property
     def visited(self) -> bool:
@@ -94,34 +99,54 @@ class GameTreeNode:
 class GameTree:
 
     PICKLE_FILENAME: str = "gametree.pickle"
+    FORMAT_VERSION: int = 2
+
+    OUTCOME_LAYER: str = "outcome"
+    DEPTH_AWARE_LAYER: str = "depth_aware"
+    DEFAULT_SCORE_FUNCTIONS: Dict[str, ScoreFunction] = {
+        OUTCOME_LAYER: outcome_score,
+        DEPTH_AWARE_LAYER: depth_aware_score,
+    }
 
     _root: GameTreeNode
     _found_nodes: Dict[Board, GameTreeNode]
+    _nodes: List[GameTreeNode]
+    _score_layers: Dict[str, List[float]]
+
+    @classmethod
+    def cache(cls) -> PickleCache:
+        return PickleCache(
+            cls.PICKLE_FILENAME,
+            PickleCache.fingerprint_of(
+                cls.FORMAT_VERSION,
+                [cls, GameTreeNode, Transition, Board, Transformation]
+            )
+        )
 
     @classmethod
     def new(cls) -> 'GameTree':
-        try:
-            return cls.from_pickle()
-        except FileNotFoundError:
-            tree = cls()
-            tree.construct()
-            tree.to_pickle()
-            return tree
+        return cls.cache().load_or_build(cls.constructed)
+
+    @classmethod
+    def constructed(cls) -> 'GameTree':
+        tree = cls()
+        tree.construct()
+        return tree
 
     @classmethod
     def from_pickle(cls) -> 'GameTree':
-        with open(cls.PICKLE_FILENAME, 'rb') as file:
-            return pickle.load(file)
+        return cls.cache().load()
 
     def to_pickle(self):
-        with open(self.PICKLE_FILENAME, 'wb') as file:
-            pickle.dump(self, file)
+        self.cache().store(self)
 
     def construct(self):
         self._root = GameTreeNode(Board())
         self._found_nodes = {Board(): self._root}
         self._construct_recursive(self._root, True)
-        self._root.determine_score(True)
+        self._index_nodes()
+        self._score_layers = {}
+        self.add_score_layers(self.DEFAULT_SCORE_FUNCTIONS)
 
     def _construct_recursive(self, node: GameTreeNode, maximizing: bool):
         if node.is_terminal or node.visited:
@@ -144,28 +169,66 @@ class GameTree:
             else:
                 node.add_child(index, self._found_nodes[board])
 
-    def _winning_move_criterion(self, maximizing: bool, score: int) -> bool:
-        return (
-            maximizing and score == Board.SCORES[Board.PLAYER_X]
-            or not maximizing and score == Board.SCORES[Board.PLAYER_O]
-        )
+    def _index_nodes(self):
+        self._nodes = [
+            node for nodes in self.nodes_by_ply() for node in nodes
+        ]
+        for index, node in enumerate(self._nodes):
+            node.index = index
+
+    def add_score_layers(self, score_functions: Dict[str, ScoreFunction]):
+        layers = {name: [None] * len(self._nodes) for name in score_functions}
+        for node in reversed(self._nodes):
+            ply = node.ply
+            if node.is_terminal:
+                for name, score_function in score_functions.items():
+                    layers[name][node.index] = score_function(node.board, ply)
+                continue
+            operator = max if ply % 2 == 0 else min
+            for scores in layers.values():
+                scores[node.index] = operator(
+                    scores[t.node.index] for t in node.children
+                )
+        self._score_layers.update(layers)
+
+    def remove_score_layer(self, name: str):
+        del self._score_layers[name]
 
-    def _tie_move_criterion(self, score: int) -> bool:
-        return score == Board.SCORES[Board.TIE]
+    @property
+    def score_layers(self) -> List[str]:
+        return list(self._score_layers)
 
-    def best_moves(self, board: Board, maximizing: bool) -> List[int]:
-        found_node = self._found_nodes[board]
-        best_transitions = [
-            t for t in found_node.children
-            if self._winning_move_criterion(maximizing, t.node.score)
+    @property
+    def root(self) -> GameTreeNode:
+        return self._root
+
+    def nodes_by_ply(self) -> List[List[GameTreeNode]]:
+        plies = [[] for _ in range(Board.SIZE + 1)]
+        for node in self._found_nodes.values():
+            plies[Board.SIZE - node.board.free_cell_amount].append(node)
+        return plies
+
+    def score(self, board: Board, layer: str = OUTCOME_LAYER) -> float:
+        return self._score_layers[layer][self._found_nodes[board].index]
+
+    def best_transitions(
+        self, node: GameTreeNode, maximizing: bool,
+        layer: str = OUTCOME_LAYER
+    ) -> List[Transition]:
+        scores = self._score_layers[layer]
+        operator = max if maximizing else min
+        best_score = operator(scores[t.node.index] for t in node.children)
+        return [
+            t for t in node.children if scores[t.node.index] == best_score
         ]
-        if not best_transitions:
-            best_transitions = [
-                t for t in found_node.children
-                if self._tie_move_criterion(t.node.score)
-            ]
-        if not best_transitions:
-            best_transitions = found_node.children[:]
+
+    def best_moves(
+        self, board: Board, maximizing: bool, layer: str = OUTCOME_LAYER
+    ) -> List[int]:
+        found_node = self._found_nodes[board]
+        best_transitions = self.best_transitions(
+            found_node, maximizing, layer
+        )
 
         transformation = Transformation.between(found_node.board, board)
         return [transformation.apply_to(t.index) for t in best_transitions]
@@ -0,0 +1,114 @@
+from typing import BinaryIO, Iterable, Iterator, List
+
+from board import Board
+
+
+class MoveLog:
+
+    MOVE_BITS: int = 4
+    MOVE_MASK: int = (1 << MOVE_BITS) - 1
+    RECORD_SIZE: int = (Board.SIZE * MOVE_BITS + 7) // 8
+    BYTE_ORDER: str = "little"
+
+    _packed: int
+    _length: int
+
+    @classmethod
+    def from_indices(cls, indices: Iterable[int]) -> 'MoveLog':
+        move_log = cls()
+        for index in indices:
+            move_log.append(index)
+        return move_log
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'MoveLog':
+        return cls(int.from_bytes(data, cls.BYTE_ORDER))
+
+    def __init__(self, packed: int = 0):
+        self._packed = packed
+        self._length = 0
+        while packed:
+            packed >>= self.MOVE_BITS
+            self._length += 1
+
+    def __repr__(self) -> str:
+        return f"MoveLog<moves: {self.indices()}>"
+
+    def __eq__(self, other: 'MoveLog') -> bool:
+        return self._packed == other._packed
+
+    def __hash__(self) -> int:
+        return hash(self._packed)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[int]:
+        packed = self._packed
+        while packed:
+            yield (packed & self.MOVE_MASK) - 1
+            packed >>= self.MOVE_BITS
+
+    def append(self, index: int):
+        self._packed |= (index + 1) << (self.MOVE_BITS * self._length)
+        self._length += 1
+
+    def indices(self) -> List[int]:
+        return list(self)
+
+    def to_bytes(self) -> bytes:
+        return self._packed.to_bytes(self.RECORD_SIZE, self.BYTE_ORDER)
+
+    def boards(self) -> Iterator[Board]:
+        board = Board()
+        is_first = True
+        for index in self:
+            board = board.place_move(is_first, index)
+            is_first = not is_first
+            yield board
+
+    def final_board(self) -> Board:
+        board = Board()
+        for board in self.boards():
+            pass
+        return board
+
+    def winner(self) -> str | None:
+        return self.final_board().winner()
+
+    @property
+    def packed(self) -> int:
+        return self._packed
+
+
+class MoveLogWriter:
+
+    _file: BinaryIO
+
+    def __init__(self, file: BinaryIO):
+        self._file = file
+
+    def write(self, move_log: MoveLog):
+        self._file.write(move_log.to_bytes())
+
+    def write_all(self, move_logs: Iterable[MoveLog]):
+        self._file.write(b"".join(m.to_bytes() for m in move_logs))
+
+
+class MoveLogReader:
+
+    CHUNK_RECORDS: int = 65536
+
+    _file: BinaryIO
+
+    def __init__(self, file: BinaryIO):
+        self._file = file
+
+    def __iter__(self) -> Iterator[MoveLog]:
+        record_size = MoveLog.RECORD_SIZE
+        chunk_size = record_size * self.CHUNK_RECORDS
+        while chunk := self._file.read(chunk_size):
+            if len(chunk) % record_size:
+                raise ValueError("Truncated move log record!")
+            for offset in range(0, len(chunk), record_size):
+                yield MoveLog.from_bytes(chunk[offset:offset + record_size])
@@ -1,11 +1,12 @@
 from abc import ABC
 from itertools import product
 from random import choice
-from time import sleep
+from time import perf_counter, sleep
 from typing import Dict, Iterator, List, Type
 
 from board import Board
 from gametree import GameTree
+from search import AnytimeSearch, SearchResult
 
 
 class Player(ABC):
@@ -13,6 +14,7 @@ class Player(ABC):
     SUBCLASSES: Dict[str, Type['Player']]
 
     _is_first: bool
+    _move_deadline: float | None = None
 
     @property
     def is_first(self) -> bool:
@@ -22,6 +24,14 @@ class Player(ABC):
     def is_first(self, value: bool):
         self._is_first = value
 
+    @property
+    def move_deadline(self) -> float | None:
+        return self._move_deadline
+
+    @move_deadline.setter
+    def move_deadline(self, value: float | None):
+        self._move_deadline = value
+
 
 class HumanPlayer(Player):
 
@@ -64,34 +74,66 @@ class ComputerPlayer(Player):
     _deterministic: bool
     _strategy: 'Strategy'
     _wait: bool
+    _search: AnytimeSearch
+    _last_search: SearchResult | None
+    _score_layer: str
 
     def __init__(
         self, deterministic: bool = False,
-        strategy: 'Strategy' = None, wait: bool = True
+        strategy: 'Strategy' = None, wait: bool = True,
+        move_deadline: float | None = None,
+        score_layer: str = GameTree.OUTCOME_LAYER
     ):
         self._difficulty = None
         self._deterministic = deterministic
         self._strategy = strategy
         self._wait = wait
+        self._move_deadline = move_deadline
+        self._search = AnytimeSearch()
+        self._last_search = None
+        self._score_layer = score_layer
 
     def __repr__(self) -> str:
         return (
             f"HumanPlayer<is_first: {self._is_first}, "
             f"search_depth: {self._difficulty}, "
             f"deterministic: {self._deterministic}, "
-            f"strategy: {self._strategy}>"
+            f"strategy: {self._strategy}, "
+            f"move_deadline: {self._move_deadline}, "
+            f"score_layer: {self._score_layer}>"
         )
 
     def set_difficulty(self, value: int):
         self._difficulty = value
 
-    def _take_best_move_criterion(self, board: Board) -> bool:
+    @property
+    def last_search(self) -> SearchResult | None:
+        return self._last_search
+
+    @staticmethod
+    def takes_best_move(board: Board, difficulty: int) -> bool:
         return (
             (Board.SIZE - board.free_cell_amount) // 2
-            - self._difficulty <= 0
+            - difficulty <= 0
         )
 
+    def _take_best_move_criterion(self, board: Board) -> bool:
+        return self.takes_best_move(board, self._difficulty)
+
     def make_move(self, board: Board) -> Board:
+        if self._move_deadline is None:
+            return self._make_unbounded_move(board)
+        start = perf_counter()
+        if self._take_best_move_criterion(board):
+            index = self._searched_move_index(board, start)
+        else:
+            index = self._any_move_index(board)
+        if self._wait:
+            wait_time = min(self.WAIT_TIME, self._move_deadline)
+            sleep(max(0, wait_time - (perf_counter() - start)))
+        return board.place_move(self._is_first, index)
+
+    def _make_unbounded_move(self, board: Board) -> Board:
         if self._wait:
             sleep(self.WAIT_TIME)
         if self._take_best_move_criterion(board):
@@ -108,8 +150,24 @@ class ComputerPlayer(Player):
         else:
             return choice(board.free_cell_indices())
 
+    def _searched_move_index(self, board: Board, start: float) -> int:
+        self._last_search = self._search.search(
+            board, self._is_first,
+            self._move_deadline - (perf_counter() - start)
+        )
+        return self._choose_best_move_index(
+            board, self._last_search.best_moves
+        )
+
     def _best_move_index(self, board: Board) -> Board:
-        best_indices = self._gametree.best_moves(board, self._is_first)
+        best_indices = self._gametree.best_moves(
+            board, self._is_first, self._score_layer
+        )
+        return self._choose_best_move_index(board, best_indices)
+
+    def _choose_best_move_index(
+        self, board: Board, best_indices: List[int]
+    ) -> int:
         if self._deterministic:
             return best_indices[
                 self._strategy.next_choice(board) % len(best_indices)
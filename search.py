@@ -0,0 +1,134 @@
+from dataclasses import dataclass
+from math import inf
+from time import perf_counter
+from typing import List
+
+from board import Board
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+@dataclass
+class SearchResult:
+
+    best_moves: List[int]
+    score: float
+    depth: int
+    complete: bool
+
+    def __repr__(self) -> str:
+        return (
+            "SearchResult:\n"
+            f"best_moves: {self.best_moves}\n"
+            f"score: {self.score}\n"
+            f"depth: {self.depth}\n"
+            f"complete: {self.complete}"
+        )
+
+
+class AnytimeSearch:
+
+    HEURISTIC_SCALE: float = 1 / (len(Board.LINE_INDICES) + 1)
+
+    _deadline: float
+    _nodes: int
+
+    def __init__(self):
+        self._deadline = inf
+        self._nodes = 0
+
+    def __repr__(self) -> str:
+        return f"AnytimeSearch<# nodes: {self._nodes}>"
+
+    @property
+    def nodes(self) -> int:
+        return self._nodes
+
+    def search(
+        self, board: Board, maximizing: bool, time_budget: float
+    ) -> SearchResult:
+        self._deadline = perf_counter() + time_budget
+        self._nodes = 0
+        max_depth = board.free_cell_amount
+        result = SearchResult(
+            board.free_cell_indices(), self._evaluate(board), 0,
+            max_depth == 0
+        )
+        for depth in range(1, max_depth + 1):
+            try:
+                result = self._search_root(
+                    board, maximizing, depth, result.best_moves
+                )
+            except SearchTimeout:
+                break
+            result.complete = depth == max_depth
+        return result
+
+    def _check_deadline(self):
+        self._nodes += 1
+        if perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+    def _search_root(
+        self, board: Board, maximizing: bool, depth: int,
+        previous_best_moves: List[int]
+    ) -> SearchResult:
+        ordered_indices = previous_best_moves + [
+            idx for idx in board.free_cell_indices()
+            if idx not in previous_best_moves
+        ]
+        operator = max if maximizing else min
+        scores = {
+            idx: self._minimax(
+                board.place_move(maximizing, idx), not maximizing,
+                depth - 1, -inf, inf
+            )
+            for idx in ordered_indices
+        }
+        best_score = operator(scores.values())
+        best_moves = [
+            idx for idx in ordered_indices if scores[idx] == best_score
+        ]
+        return SearchResult(best_moves, best_score, depth, False)
+
+    def _minimax(
+        self, board: Board, maximizing: bool, depth: int,
+        alpha: float, beta: float
+    ) -> float:
+        self._check_deadline()
+        winner = board.winner()
+        if winner is not None:
+            return Board.SCORES[winner]
+        if depth == 0:
+            return self._evaluate(board)
+        if maximizing:
+            score = -inf
+            for idx in board.free_cell_indices():
+                score = max(score, self._minimax(
+                    board.place_move(True, idx), False, depth - 1, alpha, beta
+                ))
+                alpha = max(alpha, score)
+                if alpha >= beta:
+                    break
+        else:
+            score = inf
+            for idx in board.free_cell_indices():
+                score = min(score, self._minimax(
+                    board.place_move(False, idx), True, depth - 1, alpha, beta
+                ))
+                beta = min(beta, score)
+                if alpha >= beta:
+                    break
+        return score
+
+    def _evaluate(self, board: Board) -> float:
+        open_lines = 0
+        for indices in Board.LINE_INDICES:
+            tokens = {board[idx] for idx in indices} - {Board.EMPTY}
+            if tokens == {Board.PLAYER_X}:
+                open_lines += 1
+            elif tokens == {Board.PLAYER_O}:
+                open_lines -= 1
+        return open_lines * self.HEURISTIC_SCALE